@@ -0,0 +1,98 @@
+"""
+Requests per second for manual container and scope usage and middleware, best of 5 runs
+
+Usage: python benchmarks/middleware_benchmark.py [requests count]
+"""
+
+import asyncio
+import sys
+from time import perf_counter
+
+from injectool import Container, Module, resolve, scope, use_container
+from injectool.middleware import AsgiMiddleware, WsgiMiddleware
+
+
+class Service:
+    pass
+
+
+def _create_container() -> Container:
+    module = Module()
+    module.add_singleton('singleton', Service())
+    module.add_scoped(Service, Service, lambda _: None)
+    return module.install(Container())
+
+
+def _wsgi_app(_, start_response):
+    resolve(Service)
+    start_response('200 OK', [])
+    return [b'one', b'two']
+
+
+def _manual_wsgi(container: Container):
+    def _app(environ, start_response):
+        with use_container(container), scope():
+            return list(_wsgi_app(environ, start_response))
+    return _app
+
+
+def _wsgi_client(app, count: int):
+    def start_response(*_):
+        pass
+    for _ in range(count):
+        body = app({}, start_response)
+        for _ in body:
+            pass
+        close = getattr(body, 'close', None)
+        if close is not None:
+            close()
+
+
+async def _asgi_app(_, __, send):
+    resolve(Service)
+    await send({'type': 'http.response.body', 'body': b'one', 'more_body': True})
+    await send({'type': 'http.response.body', 'body': b'two'})
+
+
+def _manual_asgi(container: Container):
+    async def _app(scope_, receive, send):
+        with use_container(container), scope():
+            await _asgi_app(scope_, receive, send)
+    return _app
+
+
+async def _asgi_client(app, count: int):
+    async def send(_):
+        pass
+    for _ in range(count):
+        await app({'type': 'http'}, None, send)
+
+
+def _measure(run, count: int, repeat: int = 5) -> float:
+    best = None
+    for _ in range(repeat):
+        start = perf_counter()
+        run(count)
+        elapsed = perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return count / best
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    container = _create_container()
+    loop = asyncio.new_event_loop()
+    cases = [
+        ('wsgi manual', lambda c: _wsgi_client(_manual_wsgi(container), c)),
+        ('wsgi middleware', lambda c: _wsgi_client(WsgiMiddleware(_wsgi_app, container), c)),
+        ('asgi manual', lambda c: loop.run_until_complete(_asgi_client(_manual_asgi(container), c))),
+        ('asgi middleware', lambda c: loop.run_until_complete(_asgi_client(AsgiMiddleware(_asgi_app, container), c)))
+    ]
+    print(f'{"case":<18}{"requests/sec":>14}')
+    for name, run in cases:
+        print(f'{name:<18}{_measure(run, count):>14,.0f}')
+    loop.close()
+
+
+if __name__ == '__main__':
+    main()
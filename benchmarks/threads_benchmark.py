@@ -0,0 +1,60 @@
+"""
+Resolves per second depending on threads count
+
+Usage: python benchmarks/threads_benchmark.py [resolves per thread]
+"""
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+
+from injectool import Container, use_container, add_singleton, add_type, add_scoped, add_per_thread
+
+
+class Service:
+    pass
+
+
+def _gil_enabled() -> bool:
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
+def _create_container() -> Container:
+    with use_container() as container:
+        add_singleton('singleton', Service())
+        add_type('type', Service)
+        add_scoped('scoped', Service)
+        add_per_thread('per_thread', Service)
+    return container
+
+
+def _resolve(container: Container, dependency, count: int):
+    resolve = container.resolve
+    for _ in range(count):
+        resolve(dependency)
+
+
+def _measure(container: Container, dependency, threads_count: int, count: int) -> float:
+    with ThreadPoolExecutor(max_workers=threads_count) as executor:
+        start = perf_counter()
+        futures = [executor.submit(_resolve, container, dependency, count) for _ in range(threads_count)]
+        for future in futures:
+            future.result()
+        elapsed = perf_counter() - start
+    return threads_count * count / elapsed
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    container = _create_container()
+    print(f'python {sys.version.split()[0]}, GIL enabled: {_gil_enabled()}')
+    print(f'{"dependency":<12}{"threads":>8}{"resolves/sec":>16}')
+    for dependency in ['singleton', 'type', 'scoped', 'per_thread']:
+        for threads_count in [1, 2, 4, 8]:
+            rate = _measure(container, dependency, threads_count, count)
+            print(f'{dependency:<12}{threads_count:>8}{rate:>16,.0f}')
+
+
+if __name__ == '__main__':
+    main()
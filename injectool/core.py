@@ -2,6 +2,7 @@
 
 from contextlib import contextmanager
 from contextvars import ContextVar
+from threading import Lock
 from typing import Any, Callable, Generator, Optional, Dict
 
 
@@ -14,15 +15,29 @@ Resolver = Callable[[], Any]
 
 
 class Container:
-    """Container for dependencies"""
+    """
+    Container for dependencies
+
+    Resolvers are stored in immutable snapshot that is replaced on every change,
+    so resolving doesn't need any locking and is safe without GIL.
+    """
 
     def __init__(self, resolvers: Optional[Dict[Dependency, Resolver]] = None):
+        self._lock = Lock()
         self._resolvers: Dict[Dependency, Resolver] = {} if resolvers is None else resolvers
         self.set(Container, lambda: self)
 
     def set(self, dependency: Dependency, resolve: Resolver):
         """Sets resolver for dependency"""
-        self._resolvers[dependency] = resolve
+        with self._lock:
+            resolvers = self._resolvers.copy()
+            resolvers[dependency] = resolve
+            self._resolvers = resolvers
+
+    def register_many(self, resolvers: Dict[Dependency, Resolver]):
+        """Sets resolvers for dependencies at once"""
+        with self._lock:
+            self._resolvers = {**self._resolvers, **resolvers}
 
     def resolve(self, dependency: Dependency) -> Any:
         """Resolve dependency"""
@@ -32,6 +47,10 @@ class Container:
             raise DependencyError(f'Dependency "{dependency_name}" is not found')
         return resolve()
 
+    def resolvers(self) -> Dict[Dependency, Resolver]:
+        """returns copy of registered resolvers"""
+        return self._resolvers.copy()
+
     def copy(self) -> 'Container':
         """returns new container with same dependencies"""
         return Container(self._resolvers.copy())
@@ -0,0 +1,104 @@
+"""Memory footprint of cached instances"""
+
+from gc import get_referents
+from sys import getsizeof
+from types import FunctionType, MethodType, ModuleType
+from typing import AbstractSet, Any, List, NamedTuple, Optional, Tuple
+
+from injectool.core import Container, Dependency, get_container
+from injectool.resolvers import DependencyScope, ScopeResolver, SingletonResolver, ThreadResolver
+
+SINGLETON = 'singleton'
+SCOPED = 'scoped'
+PER_THREAD = 'per_thread'
+
+_SIZE_EXCLUDED = (type, ModuleType, FunctionType, MethodType,
+                  Container, DependencyScope, ScopeResolver, SingletonResolver, ThreadResolver)
+
+
+class CachedInstance(NamedTuple):
+    """
+    Cached instance info.
+    Owner is scope id for scoped instance, thread id for per thread instance and None for singleton.
+    Instance itself is not referenced to not keep it alive.
+    """
+    dependency: Dependency
+    kind: str
+    owner: Optional[int]
+    instance_id: int
+    type_name: str
+    size: int
+
+    @property
+    def key(self) -> Tuple[Any, str, Optional[int], int]:
+        """identifies instance between snapshots"""
+        return self.dependency, self.kind, self.owner, self.instance_id
+
+
+def approximate_size(instance: Any, excluded_ids: AbstractSet[int] = frozenset()) -> int:
+    """
+    returns size in bytes of instance and objects referenced by it.
+    Referenced types, modules, functions, containers, scopes, resolvers and objects with excluded ids are not counted.
+    """
+    size = 0
+    seen = set(excluded_ids)
+    seen.discard(id(instance))
+    objects = [instance]
+    while objects:
+        obj = objects.pop()
+        if id(obj) in seen or (obj is not instance and isinstance(obj, _SIZE_EXCLUDED)):
+            continue
+        seen.add(id(obj))
+        size += getsizeof(obj)
+        objects.extend(get_referents(obj))
+    return size
+
+
+class MemorySnapshot:
+    """Cached instances at some point of time"""
+    def __init__(self, instances: List[CachedInstance]):
+        self.instances: List[CachedInstance] = instances
+
+    @property
+    def size(self) -> int:
+        """total approximate size of cached instances"""
+        return sum(instance.size for instance in self.instances)
+
+    @property
+    def scopes_count(self) -> int:
+        """count of scopes holding instances"""
+        return len({instance.owner for instance in self.instances if instance.kind == SCOPED})
+
+    def diff(self, previous: 'MemorySnapshot') -> Tuple[List[CachedInstance], List[CachedInstance]]:
+        """returns instances added and removed since previous snapshot"""
+        previous_keys = {instance.key for instance in previous.instances}
+        current_keys = {instance.key for instance in self.instances}
+        added = [instance for instance in self.instances if instance.key not in previous_keys]
+        removed = [instance for instance in previous.instances if instance.key not in current_keys]
+        return added, removed
+
+
+def take_snapshot(container: Optional[Container] = None) -> MemorySnapshot:
+    """
+    returns cached instances of passed or current container.
+    Cached instances referenced by other cached instance are not counted in its size.
+    """
+    container = get_container() if container is None else container
+    cached = []
+    for dependency, resolve in container.resolvers().items():
+        resolver = getattr(resolve, '__self__', resolve)
+        if isinstance(resolver, ScopeResolver):
+            cached.extend((dependency, SCOPED, id(scope), instance)
+                          for scope, instance in resolver.instances().items())
+        elif isinstance(resolver, ThreadResolver):
+            cached.extend((dependency, PER_THREAD, thread.ident, instance)
+                          for thread, instance in resolver.instances().items())
+        elif isinstance(resolver, SingletonResolver):
+            cached.append((dependency, SINGLETON, None, resolver.value))
+
+    cached_ids = {id(item[-1]) for item in cached}
+    return MemorySnapshot([
+        CachedInstance(dependency, kind, owner, id(instance), type(instance).__name__,
+                       approximate_size(instance, cached_ids))
+        for dependency, kind, owner, instance in cached
+    ])
@@ -0,0 +1,102 @@
+"""WSGI and ASGI middleware using container and scope per request"""
+
+from asyncio import get_event_loop
+from concurrent.futures import Executor
+from contextvars import Context, copy_context
+from typing import Callable, Iterable, Iterator, Optional
+
+from injectool.core import Container, get_container, use_container
+from injectool.resolvers import DependencyScope, use_scope
+
+
+class _ScopedBody:
+    """Iterates response body in request context and disposes scope after"""
+    def __init__(self, context: Context, body: Iterable[bytes], scope: DependencyScope):
+        self._context: Context = context
+        self._body: Iterable[bytes] = body
+        self._iterator: Iterator[bytes] = context.run(iter, body)
+        self._scope: DependencyScope = scope
+        self._closed: bool = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> bytes:
+        try:
+            return self._context.run(next, self._iterator)
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self):
+        """closes body and disposes scope in request context"""
+        if not self._closed:
+            self._closed = True
+            self._context.run(self._close)
+
+    def _close(self):
+        try:
+            close = getattr(self._body, 'close', None)
+            if close is not None:
+                close()
+        finally:
+            self._scope.dispose()
+
+
+class WsgiMiddleware:
+    """
+    Uses container and new scope for every WSGI request.
+    Scope is exited after response body is iterated or closed
+    or right away if application returns list or tuple.
+    """
+    def __init__(self, app: Callable, container: Optional[Container] = None,
+                 executor: Optional[Executor] = None, timeout: Optional[float] = None):
+        self._app: Callable = app
+        self._container: Container = get_container() if container is None else container
+        self._executor: Optional[Executor] = executor
+        self._timeout: Optional[float] = timeout
+
+    def __call__(self, environ: dict, start_response: Callable) -> Iterable[bytes]:
+        scope = DependencyScope(self._executor, self._timeout)
+        with use_container(self._container), use_scope(scope):
+            try:
+                result = self._app(environ, start_response)
+            except BaseException:
+                scope.dispose()
+                raise
+            if isinstance(result, (list, tuple)):
+                scope.dispose()
+                return result
+            return _ScopedBody(copy_context(), result, scope)
+
+
+class AsgiMiddleware:
+    """
+    Uses container and new scope for every ASGI http and websocket connection.
+    Scope is exited after application is finished including streaming response.
+    If executor is passed scope is disposed in default executor of event loop to not block it.
+    """
+    def __init__(self, app: Callable, container: Optional[Container] = None,
+                 executor: Optional[Executor] = None, timeout: Optional[float] = None):
+        self._app: Callable = app
+        self._container: Container = get_container() if container is None else container
+        self._executor: Optional[Executor] = executor
+        self._timeout: Optional[float] = timeout
+
+    async def __call__(self, scope: dict, receive: Callable, send: Callable):
+        if scope['type'] not in ('http', 'websocket'):
+            await self._app(scope, receive, send)
+            return
+
+        if self._executor is None:
+            with use_container(self._container), DependencyScope():
+                await self._app(scope, receive, send)
+            return
+
+        dependency_scope = DependencyScope(self._executor, self._timeout)
+        with use_container(self._container), use_scope(dependency_scope):
+            try:
+                await self._app(scope, receive, send)
+            finally:
+                context = copy_context()
+                await get_event_loop().run_in_executor(None, context.run, dependency_scope.dispose)
@@ -0,0 +1,50 @@
+"""Grouped dependencies registration"""
+
+from typing import Any, Callable, Dict, Optional, Type
+
+from injectool.core import Container, Dependency, Resolver, get_container
+from injectool.resolvers import ScopeResolver, SingletonResolver, ThreadResolver
+
+
+class Module:
+    """Group of dependencies that can be installed to container at once"""
+
+    def __init__(self):
+        self._factories: Dict[Dependency, Callable[[], Resolver]] = {}
+
+    def add(self, dependency: Dependency, resolve: Resolver):
+        """Adds custom resolver"""
+        self._factories[dependency] = lambda: resolve
+
+    def add_singleton(self, dependency: Dependency, value: Any):
+        """Adds single value"""
+        self.add(dependency, SingletonResolver(value))
+
+    def add_type(self, dependency: Dependency, type_: Type):
+        """Adds type instance per resolve call"""
+        self.add(dependency, type_)
+
+    def add_scoped(self, dependency: Dependency, type_: Type, dispose: Optional[Callable[[Any], None]] = None):
+        """Adds type instance per scope"""
+        self._factories[dependency] = lambda: ScopeResolver(type_, dispose).resolve
+
+    def add_per_thread(self, dependency: Dependency, type_: Type):
+        """Adds type instance per thread"""
+        self._factories[dependency] = lambda: ThreadResolver(type_).resolve
+
+    def factories(self) -> Dict[Dependency, Callable[[], Resolver]]:
+        """returns copy of resolver factories by dependency"""
+        return self._factories.copy()
+
+    def include(self, module: 'Module'):
+        """Adds all dependencies from passed module"""
+        self._factories.update(module.factories())
+
+    def install(self, container: Optional[Container] = None) -> Container:
+        """
+        Registers all dependencies to passed or current container.
+        Scoped and per thread instances are not shared between containers.
+        """
+        container = get_container() if container is None else container
+        container.register_many({dependency: create() for dependency, create in self._factories.items()})
+        return container
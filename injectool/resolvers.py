@@ -1,19 +1,32 @@
 """Dependency resolvers used by container"""
 
-from contextvars import ContextVar, Token
+from concurrent.futures import Executor, Future, TimeoutError as FutureTimeoutError
+from contextvars import ContextVar, Token, copy_context
 import threading
-from typing import Any, Callable, Dict, List, Optional, Type
+from time import perf_counter
+from typing import Any, Callable, ContextManager, Dict, Iterable, List, MutableMapping, Optional, Tuple, Type
+from weakref import WeakKeyDictionary
 
-from injectool.core import get_container, Dependency, Resolver
+from injectool.core import get_container, Dependency, DependencyError, Resolver
 
 
 def add(dependency: Dependency, resolve: Resolver):
     get_container().set(dependency, resolve)
 
 
+class SingletonResolver:
+    """Resolver for single value"""
+    def __init__(self, value: Any):
+        self.value: Any = value
+
+    def __call__(self) -> Any:
+        """returns value"""
+        return self.value
+
+
 def add_singleton(dependency: Dependency, value: Any):
     """Adds single value"""
-    get_container().set(dependency, lambda: value)
+    get_container().set(dependency, SingletonResolver(value))
 
 
 def add_type(dependency: Dependency, type_: Type):
@@ -22,13 +35,57 @@ def add_type(dependency: Dependency, type_: Type):
 
 
 _CURRENT_SCOPE = ContextVar('scope')
+_SCOPES_LOCK = threading.Lock()
+
+
+class DisposeError(DependencyError):
+    """Raised on scope exit if any of dispose callbacks failed"""
+    def __init__(self, errors: List[Exception]):
+        super().__init__(f'{len(errors)} scope exit callback(s) failed')
+        self.errors: List[Exception] = errors
+
+
+class _DisposeTask:
+    """Exit callback submitted to executor"""
+    def __init__(self, scope_: 'DependencyScope', callback: Callable[['DependencyScope'], None]):
+        self.scope: 'DependencyScope' = scope_
+        self.callback: Callable[['DependencyScope'], None] = callback
+        self.started = threading.Event()
+        self.start: float = 0
+        self.future: Optional[Future] = None
+
+    def run(self):
+        """calls callback"""
+        self.start = perf_counter()
+        self.started.set()
+        self.callback(self.scope)
+
+    def wait(self, timeout: Optional[float]):
+        """waits callback is finished but not longer than timeout after its start"""
+        if timeout is None:
+            self.future.result()
+            return
+        self.started.wait()
+        self.future.result(max(self.start + timeout - perf_counter(), 0))
 
 
 class DependencyScope:
-    """Dependency scope"""
-    def __init__(self):
-        self._resent_token: Optional[Token] = None
-        self._exit_callbacks: List[Callable[['DependencyScope'], None]] = []
+    """
+    Dependency scope
+
+    Exit callbacks are called in reverse order.
+    If executor is passed callbacks are called concurrently
+    and timeout limits time in seconds for every callback after it is started.
+    """
+    def __init__(self, executor: Optional[Executor] = None, timeout: Optional[float] = None):
+        if timeout is not None and executor is None:
+            raise ValueError('timeout can be used only with executor')
+        self._reset_token: Optional[Token] = None
+        self._lock: Optional[threading.Lock] = None
+        self._exit_callbacks: Optional[List[Callable[['DependencyScope'], None]]] = None
+        self._executor: Optional[Executor] = executor
+        self._timeout: Optional[float] = timeout
+        self.dispose_duration: Optional[float] = None
 
     def __enter__(self):
         """sets scope as current"""
@@ -36,25 +93,110 @@ class DependencyScope:
         return self
 
     def __exit__(self, *_):
-        """deletes scope as current"""
-        if self._resent_token is not None:
-            _CURRENT_SCOPE.reset(self._resent_token)
-            self._resent_token = None
-        for callback in self._exit_callbacks:
-            callback(self)
-        self._exit_callbacks.clear()
+        """deletes scope as current and disposes it"""
+        if self._reset_token is not None:
+            _CURRENT_SCOPE.reset(self._reset_token)
+            self._reset_token = None
+        self.dispose()
+
+    def dispose(self):
+        """calls exit callbacks"""
+        if self._lock is None:
+            self.dispose_duration = 0.0
+            return
+        with self._lock:
+            callbacks, self._exit_callbacks = self._exit_callbacks or [], None
+        callbacks.reverse()
+
+        start = perf_counter()
+        if self._executor is None:
+            errors = self._dispose_serially(callbacks)
+        else:
+            errors = self._dispose_concurrently(callbacks)
+        self.dispose_duration = perf_counter() - start
+
+        if errors:
+            raise DisposeError(errors)
+
+    def _dispose_serially(self, callbacks: Iterable[Callable[['DependencyScope'], None]]) -> List[Exception]:
+        errors = []
+        for callback in callbacks:
+            try:
+                callback(self)
+            except Exception as error: # pylint: disable=broad-except
+                errors.append(error)
+        return errors
+
+    def _dispose_concurrently(self, callbacks: Iterable[Callable[['DependencyScope'], None]]) -> List[Exception]:
+        tasks = [_DisposeTask(self, callback) for callback in callbacks]
+        submitted, not_submitted = self._submit(tasks)
+
+        errors = []
+        timed_out = False
+        for task in submitted:
+            if (timed_out or not task.started.wait(self._timeout)) and task.future.cancel():
+                # executor can be blocked by timed out callbacks so not started ones are called here
+                errors.extend(self._dispose_serially([task.callback]))
+                continue
+            try:
+                task.wait(self._timeout)
+            except FutureTimeoutError:
+                timed_out = True
+                errors.append(TimeoutError(f'Scope exit callback is not finished in {self._timeout} seconds'))
+            except Exception as error: # pylint: disable=broad-except
+                errors.append(error)
+        errors.extend(self._dispose_serially(task.callback for task in not_submitted))
+        return errors
+
+    def _submit(self, tasks: List[_DisposeTask]) -> Tuple[List[_DisposeTask], List[_DisposeTask]]:
+        """submits tasks to executor and returns submitted and not submitted ones"""
+        for index, task in enumerate(tasks):
+            try:
+                task.future = self._executor.submit(copy_context().run, task.run)
+            except Exception: # pylint: disable=broad-except
+                return tasks[:index], tasks[index:]
+        return tasks, []
 
     def on_exit(self, callback: Callable[['DependencyScope'], None]):
         """sets callback for scope disposing"""
-        self._exit_callbacks.append(callback)
+        if self._lock is None:
+            with _SCOPES_LOCK:
+                if self._lock is None:
+                    self._lock = threading.Lock()
+        with self._lock:
+            if self._exit_callbacks is None:
+                self._exit_callbacks = []
+            self._exit_callbacks.append(callback)
 
 
-def scope() -> DependencyScope:
+def scope(executor: Optional[Executor] = None, timeout: Optional[float] = None) -> DependencyScope:
     """returns new instance of scope"""
-    return DependencyScope()
+    return DependencyScope(executor, timeout)
+
+
+class _ScopeUsage:
+    """Sets scope as current without disposing it"""
+    __slots__ = ('_scope', '_reset_token')
+
+    def __init__(self, scope_: DependencyScope):
+        self._scope: DependencyScope = scope_
+        self._reset_token: Optional[Token] = None
 
+    def __enter__(self) -> DependencyScope:
+        self._reset_token = _CURRENT_SCOPE.set(self._scope)
+        return self._scope
+
+    def __exit__(self, *_):
+        _CURRENT_SCOPE.reset(self._reset_token)
+
+
+def use_scope(scope_: DependencyScope) -> ContextManager[DependencyScope]:
+    """Uses passed scope as current without disposing it"""
+    return _ScopeUsage(scope_)
 
-_CURRENT_SCOPE.set(DependencyScope())
+
+_DEFAULT_SCOPE = DependencyScope()
+_MISSING = object()
 
 
 class ScopeResolver:
@@ -62,25 +204,35 @@ class ScopeResolver:
     def __init__(self, type_: Type, dispose: Optional[Callable[[Any], None]]):
         self._type: Type = type_
         self._dispose: Optional[Callable[[Any], None]] = dispose
+        self._lock = threading.Lock()
         self._instances: Dict[DependencyScope, Any] = {}
 
     def resolve(self) -> Any:
         """returns type instance for current scope"""
-        scope = _CURRENT_SCOPE.get()
-        if scope not in self._instances:
-            instance = self._type()
-            scope.on_exit(self._on_scope_exit)
-            self._instances[scope] = instance
-        else:
-            instance = self._instances[scope]
-
-        return instance
+        scope = _CURRENT_SCOPE.get(_DEFAULT_SCOPE)
+        instance = self._instances.get(scope, _MISSING)
+        if instance is not _MISSING:
+            return instance
+
+        instance = self._type()
+        with self._lock:
+            current = self._instances.setdefault(scope, instance)
+            if current is instance:
+                scope.on_exit(self._on_scope_exit)
+        if current is not instance and self._dispose is not None:
+            self._dispose(instance)
+        return current
+
+    def instances(self) -> Dict[DependencyScope, Any]:
+        """returns current instances by scope"""
+        with self._lock:
+            return self._instances.copy()
 
     def _on_scope_exit(self, scope: DependencyScope):
-        if scope in self._instances:
-            instance = self._instances.pop(scope)
-            if self._dispose is not None:
-                self._dispose(instance)
+        with self._lock:
+            instance = self._instances.pop(scope, _MISSING)
+        if instance is not _MISSING and self._dispose is not None:
+            self._dispose(instance)
 
 
 def add_scoped(dependency: Dependency, type_: Type, dispose: Optional[Callable[[Any], None]] = None):
@@ -92,21 +244,25 @@ class ThreadResolver:
     """Instance resolver for thread"""
     def __init__(self, type_: Type):
         self._type: Type = type_
-        self._instances: Dict[int, Any] = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._instances: MutableMapping[threading.Thread, Any] = WeakKeyDictionary()
 
     def resolve(self) -> Any:
         """returns type instance for current thread"""
-        thread = threading.current_thread()
-        thread_id = hash(thread)
-
-        if thread_id not in self._instances:
+        instance = getattr(self._local, 'instance', _MISSING)
+        if instance is _MISSING:
             instance = self._type()
-            self._instances[thread_id] = instance
-        else:
-            instance = self._instances[thread_id]
-
+            self._local.instance = instance
+            with self._lock:
+                self._instances[threading.current_thread()] = instance
         return instance
 
+    def instances(self) -> Dict[threading.Thread, Any]:
+        """returns current instances by thread"""
+        with self._lock:
+            return dict(self._instances.items())
+
 
 def add_per_thread(dependency: Dependency, type_: Type):
     get_container().set(dependency, ThreadResolver(type_).resolve)
@@ -51,6 +51,26 @@ class ContainerTests:
 
         assert check(actual)
 
+    def test_register_many(self):
+        """register_many() should set all passed resolvers"""
+        self.container.set('key', lambda: 0)
+
+        self.container.register_many({'key': lambda: 1, 'other': lambda: 2})
+
+        assert self.container.resolve('key') == 1
+        assert self.container.resolve('other') == 2
+        assert self.container.resolve(Container) is self.container
+
+    def test_resolvers(self):
+        """resolvers() should return copy of registered resolvers"""
+        resolve = lambda: 1
+        self.container.set('key', resolve)
+
+        actual = self.container.resolvers()
+        actual.clear()
+
+        assert self.container.resolvers()['key'] is resolve
+
     def test_resolve_self(self):
         """should resolve self instance of Container"""
         actual = self.container.resolve(Container)
@@ -100,6 +120,17 @@ class ContainerTests:
         assert self.container.resolve('value') == 0
         assert copy.resolve('value') == 1
 
+    def test_set_keeps_previous_resolvers(self):
+        """set() should not change resolvers that are already used for resolving"""
+        resolvers = {'key': lambda: 0}
+        container = Container(resolvers)
+
+        container.set('key', lambda: 1)
+        container.set('other', lambda: 2)
+
+        assert list(resolvers.keys()) == ['key']
+        assert resolvers['key']() == 0
+
 
 class CurrentContainerTests:
     """Current container tests"""
@@ -0,0 +1,157 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import get_ident
+
+from pytest import mark
+
+from injectool.core import Container
+from injectool.memory import PER_THREAD, SCOPED, SINGLETON, MemorySnapshot, approximate_size, take_snapshot
+from injectool.module import Module
+from injectool.resolvers import DependencyScope, SingletonResolver
+
+
+class SomeClass:
+    def __init__(self):
+        self.data = [0] * 100
+
+
+def _create_container() -> Container:
+    module = Module()
+    module.add_singleton('singleton', SomeClass())
+    module.add_type('type', SomeClass)
+    module.add_scoped('scoped', SomeClass)
+    module.add_per_thread('per_thread', SomeClass)
+    return module.install(Container())
+
+
+class ApproximateSizeTests:
+    """approximate_size() tests"""
+
+    @staticmethod
+    @mark.parametrize('instance', [1, 'value', [1, 2], SomeClass()])
+    def test_includes_own_size(instance):
+        """should be not less than own size"""
+        assert approximate_size(instance) >= instance.__sizeof__()
+
+    @staticmethod
+    def test_includes_referenced():
+        """should include referenced objects"""
+        instance = SomeClass()
+
+        assert approximate_size(instance) > approximate_size(instance.data)
+
+    @staticmethod
+    def test_excludes_container():
+        """should not count referenced container and its resolvers"""
+        container = _create_container()
+        instance = SomeClass()
+        size = approximate_size(instance)
+        with DependencyScope():
+            container.resolve('scoped')
+            instance.container = container
+            instance.resolve = container.resolve
+
+            actual = approximate_size(instance)
+
+        assert actual - size < 1000
+
+    @staticmethod
+    def test_excluded_ids():
+        """should not count objects with excluded ids"""
+        instance = SomeClass()
+
+        assert approximate_size(instance, {id(instance.data)}) < approximate_size(instance)
+        assert approximate_size(instance, {id(instance)}) == approximate_size(instance)
+
+    @staticmethod
+    def test_root_container():
+        """should count container passed as instance"""
+        assert approximate_size(Container()) > 0
+
+
+class TakeSnapshotTests:
+    """take_snapshot() tests"""
+
+    @staticmethod
+    def test_empty():
+        """should not contain not resolved instances"""
+        actual = take_snapshot(_create_container())
+
+        assert [(i.dependency, i.kind) for i in actual.instances] == [('singleton', SINGLETON)]
+
+    @staticmethod
+    def test_cached_instances():
+        """should contain cached instances"""
+        container = _create_container()
+
+        with DependencyScope() as scope:
+            scoped = container.resolve('scoped')
+            container.resolve('per_thread')
+            container.resolve('type')
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                executor.submit(container.resolve, 'per_thread').result()
+
+            actual = take_snapshot(container)
+
+        kinds = sorted((i.dependency, i.kind) for i in actual.instances)
+        assert kinds == [('per_thread', PER_THREAD), ('per_thread', PER_THREAD),
+                         ('scoped', SCOPED), ('singleton', SINGLETON)]
+        scoped_info = next(i for i in actual.instances if i.kind == SCOPED)
+        assert scoped_info.owner == id(scope)
+        assert scoped_info.instance_id == id(scoped)
+        assert scoped_info.type_name == SomeClass.__name__
+        assert get_ident() in {i.owner for i in actual.instances if i.kind == PER_THREAD}
+        assert actual.scopes_count == 1
+        assert actual.size == sum(i.size for i in actual.instances)
+
+    @staticmethod
+    def test_cached_instances_counted_once():
+        """should not count cached instance in size of other cached instance"""
+        module = Module()
+        module.add_singleton('singleton', SomeClass())
+        module.add_scoped('scoped', SomeClass)
+        container = module.install(Container())
+
+        with DependencyScope():
+            container.resolve('scoped').singleton = container.resolve('singleton')
+            actual = take_snapshot(container)
+
+        sizes = {i.dependency: i.size for i in actual.instances}
+        assert sizes['scoped'] < sizes['singleton'] + approximate_size(SomeClass().data)
+
+    @staticmethod
+    def test_custom_singleton():
+        """should find singleton added as SingletonResolver"""
+        container = Container()
+        value = SomeClass()
+        container.set('key', SingletonResolver(value))
+
+        actual = take_snapshot(container)
+
+        assert [(i.dependency, i.instance_id) for i in actual.instances] == [('key', id(value))]
+
+    @staticmethod
+    def test_diff():
+        """diff() should return added and removed instances"""
+        container = _create_container()
+        before = take_snapshot(container)
+
+        with DependencyScope():
+            container.resolve('scoped')
+            during = take_snapshot(container)
+        after = take_snapshot(container)
+
+        added, removed = during.diff(before)
+        assert [i.dependency for i in added] == ['scoped']
+        assert removed == []
+        added, removed = after.diff(during)
+        assert added == []
+        assert [i.dependency for i in removed] == ['scoped']
+        assert after.diff(before) == ([], [])
+
+    @staticmethod
+    def test_empty_snapshot():
+        """empty snapshot should have zero size"""
+        actual = MemorySnapshot([])
+
+        assert actual.size == 0
+        assert actual.scopes_count == 0
@@ -0,0 +1,212 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import get_ident
+from typing import Callable, Optional
+from unittest.mock import Mock
+
+from pytest import mark, raises
+
+from injectool.core import Container, get_container
+from injectool.middleware import AsgiMiddleware, WsgiMiddleware
+from injectool.module import Module
+
+
+class SomeClass:
+    pass
+
+
+def _create_container(dispose: Optional[Callable] = None) -> Container:
+    module = Module()
+    module.add_scoped(SomeClass, SomeClass, dispose)
+    return module.install(Container())
+
+
+class WsgiMiddlewareTests:
+    """WsgiMiddleware class tests"""
+
+    @staticmethod
+    def test_uses_container_and_scope():
+        """should resolve dependencies from container with scope per request"""
+        container = _create_container()
+        instances = []
+
+        def app(_, start_response):
+            assert get_container() is container
+            instances.append(container.resolve(SomeClass))
+            assert container.resolve(SomeClass) is instances[-1]
+            start_response('200 OK', [])
+            return [b'body']
+
+        middleware = WsgiMiddleware(app, container)
+
+        assert list(middleware({}, Mock())) == [b'body']
+        assert list(middleware({}, Mock())) == [b'body']
+        assert instances[0] is not instances[1]
+
+    @staticmethod
+    def test_streaming():
+        """should dispose scope after body is iterated"""
+        dispose = Mock()
+        container = _create_container(dispose)
+        closed = Mock()
+
+        class Body:
+            def __iter__(self):
+                yield b'one'
+                yield str(id(container.resolve(SomeClass))).encode()
+
+            def close(self):
+                closed()
+
+        response = WsgiMiddleware(lambda *_: Body(), container)({}, Mock())
+        chunks = [next(response), next(response)]
+
+        dispose.assert_not_called()
+        assert list(response) == []
+
+        instance = dispose.call_args[0][0]
+        assert chunks == [b'one', str(id(instance)).encode()]
+        closed.assert_called_once_with()
+
+    @staticmethod
+    def test_close():
+        """should dispose scope if body is closed before iterated"""
+        dispose = Mock()
+        container = _create_container(dispose)
+
+        def body():
+            container.resolve(SomeClass)
+            yield b'one'
+            yield b'two'
+
+        response = WsgiMiddleware(lambda *_: body(), container)({}, Mock())
+        next(response)
+        dispose.assert_not_called()
+
+        response.close()
+
+        dispose.assert_called_once()
+
+    @staticmethod
+    def test_list_body():
+        """should dispose scope right away for list body"""
+        dispose = Mock()
+        container = _create_container(dispose)
+
+        def app(*_):
+            container.resolve(SomeClass)
+            return [b'body']
+
+        actual = WsgiMiddleware(app, container)({}, Mock())
+
+        assert actual == [b'body']
+        dispose.assert_called_once()
+
+    @staticmethod
+    @mark.parametrize('body', [[b'body'], iter([b'body'])])
+    def test_dispose_in_container(body):
+        """should dispose scope with request container as current"""
+        containers = []
+        container = _create_container(lambda _: containers.append(get_container()))
+
+        def app(*_):
+            container.resolve(SomeClass)
+            return body
+
+        response = WsgiMiddleware(app, container)({}, Mock())
+        list(response)
+
+        assert containers == [container]
+
+    @staticmethod
+    def test_app_error():
+        """should dispose scope and raise app error"""
+        dispose = Mock()
+        container = _create_container(dispose)
+
+        def app(*_):
+            container.resolve(SomeClass)
+            raise ValueError()
+
+        with raises(ValueError):
+            WsgiMiddleware(app, container)({}, Mock())
+
+        dispose.assert_called_once()
+
+
+class AsgiMiddlewareTests:
+    """AsgiMiddleware class tests"""
+
+    @staticmethod
+    @mark.asyncio
+    async def test_uses_container_and_scope():
+        """should resolve dependencies from container with scope per request"""
+        dispose = Mock()
+        container = _create_container(dispose)
+        instances = []
+
+        async def app(_, __, send):
+            assert get_container() is container
+            instances.append(container.resolve(SomeClass))
+            await send({'type': 'http.response.body', 'body': b'one', 'more_body': True})
+            assert dispose.call_count == len(instances) - 1
+            await send({'type': 'http.response.body', 'body': b'two'})
+
+        middleware = AsgiMiddleware(app, container)
+        send = Mock()
+
+        async def _send(message):
+            send(message)
+
+        await middleware({'type': 'http'}, None, _send)
+        await middleware({'type': 'http'}, None, _send)
+
+        assert instances[0] is not instances[1]
+        assert dispose.call_count == 2
+        assert send.call_count == 4
+
+    @staticmethod
+    @mark.asyncio
+    async def test_dispose_with_executor():
+        """should dispose scope outside of event loop thread if executor is passed"""
+        threads = []
+        container = _create_container(lambda _: threads.append(get_ident()))
+
+        async def app(*_):
+            container.resolve(SomeClass)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            await AsgiMiddleware(app, container, executor, timeout=1)({'type': 'http'}, None, None)
+
+        assert len(threads) == 1
+        assert threads[0] != get_ident()
+
+    @staticmethod
+    @mark.asyncio
+    @mark.parametrize('use_executor', [False, True])
+    async def test_dispose_in_container(use_executor):
+        """should dispose scope with request container as current"""
+        containers = []
+        container = _create_container(lambda _: containers.append(get_container()))
+
+        async def app(*_):
+            container.resolve(SomeClass)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            middleware = AsgiMiddleware(app, container, executor if use_executor else None)
+            await middleware({'type': 'http'}, None, None)
+
+        assert containers == [container]
+
+    @staticmethod
+    @mark.asyncio
+    async def test_lifespan():
+        """should pass lifespan without scope"""
+        app = Mock()
+
+        async def _app(*args):
+            app(*args)
+
+        scope = {'type': 'lifespan'}
+        await AsgiMiddleware(_app, Container())(scope, None, None)
+
+        app.assert_called_once_with(scope, None, None)
@@ -0,0 +1,100 @@
+from unittest.mock import Mock
+
+from pytest import mark
+
+from injectool.core import Container, use_container
+from injectool.module import Module
+from injectool.resolvers import DependencyScope
+
+
+class SomeClass:
+    pass
+
+
+class ModuleTests:
+    """Module class tests"""
+
+    @staticmethod
+    def test_install():
+        """install() should register all module dependencies to container"""
+        module = Module()
+        value = SomeClass()
+        module.add('custom', lambda: 1)
+        module.add_singleton('singleton', value)
+        module.add_type('type', SomeClass)
+        module.add_scoped('scoped', SomeClass)
+        module.add_per_thread('per_thread', SomeClass)
+        container = Container()
+
+        actual = module.install(container)
+
+        assert actual is container
+        assert container.resolve('custom') == 1
+        assert container.resolve('singleton') is value
+        assert isinstance(container.resolve('type'), SomeClass)
+        assert container.resolve('type') is not container.resolve('type')
+        assert container.resolve('scoped') is container.resolve('scoped')
+        assert container.resolve('per_thread') is container.resolve('per_thread')
+
+    @staticmethod
+    def test_install_current_container():
+        """install() should use current container by default"""
+        module = Module()
+        module.add_singleton('key', 'value')
+
+        with use_container() as container:
+            actual = module.install()
+
+        assert actual is container
+        assert container.resolve('key') == 'value'
+
+    @staticmethod
+    @mark.parametrize('dependency', ['scoped', 'per_thread'])
+    def test_install_separate_instances(dependency):
+        """scoped and per thread instances should not be shared between containers"""
+        module = Module()
+        module.add_scoped('scoped', SomeClass)
+        module.add_per_thread('per_thread', SomeClass)
+        one, two = module.install(Container()), module.install(Container())
+
+        with DependencyScope():
+            assert one.resolve(dependency) is not two.resolve(dependency)
+
+    @staticmethod
+    def test_add_scoped_dispose():
+        """should pass dispose to scoped resolver"""
+        module = Module()
+        dispose = Mock()
+        module.add_scoped('scoped', SomeClass, dispose)
+        container = module.install(Container())
+
+        with DependencyScope():
+            instance = container.resolve('scoped')
+
+        dispose.assert_called_once_with(instance)
+
+    @staticmethod
+    def test_factories():
+        """factories() should return copy of resolver factories"""
+        module = Module()
+        module.add_singleton('key', 1)
+
+        actual = module.factories()
+        actual.clear()
+
+        assert list(module.factories().keys()) == ['key']
+        assert module.factories()['key']()() == 1
+
+    @staticmethod
+    def test_include():
+        """include() should add dependencies of passed module"""
+        module, other = Module(), Module()
+        module.add_singleton('key', 0)
+        other.add_singleton('key', 1)
+        other.add_singleton('other', 2)
+
+        module.include(other)
+        container = module.install(Container())
+
+        assert container.resolve('key') == 1
+        assert container.resolve('other') == 2
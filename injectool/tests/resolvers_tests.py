@@ -1,10 +1,14 @@
 from concurrent.futures.thread import ThreadPoolExecutor
+from contextvars import copy_context
+from threading import Barrier, Event, Thread
+from time import perf_counter, sleep
 from unittest.mock import Mock, call
 
-from pytest import mark, fixture
+from pytest import mark, fixture, raises
 
-from injectool.core import Container, resolve, use_container
-from injectool.resolvers import DependencyScope, add, add_per_thread, add_scoped, add_singleton, add_type, scope
+from injectool.core import Container, get_container, resolve, use_container
+from injectool.resolvers import DependencyScope, DisposeError, scope, use_scope
+from injectool.resolvers import add, add_per_thread, add_scoped, add_singleton, add_type
 
 
 class SomeClass:
@@ -111,6 +115,47 @@ class ScopesTests:
         assert isinstance(actual, type_)
         assert actual is resolve(dependency)
 
+    def test_add_scoped_nested_exit(self):
+        """should use outer scope instance after nested scope is exited"""
+        add_scoped(SomeClass, SomeClass)
+
+        with DependencyScope():
+            outer = resolve(SomeClass)
+            with DependencyScope():
+                inner = resolve(SomeClass)
+
+            assert resolve(SomeClass) is outer
+            assert inner is not outer
+
+    def test_add_scoped_creates_in_parallel(self):
+        """should create instances for different scopes in parallel"""
+        barrier = Barrier(2, timeout=5)
+
+        class Slow:
+            def __init__(self):
+                barrier.wait()
+
+        add_scoped(Slow, Slow)
+
+        def _resolve():
+            with DependencyScope():
+                return self.container.resolve(Slow)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(_resolve) for _ in range(2)]
+            one, two = [future.result() for future in futures]
+
+        assert one is not two
+
+    def test_add_scoped_default_in_thread(self):
+        """should use default scope in new thread"""
+        add_scoped(SomeClass, SomeClass)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            actual = executor.submit(self.container.resolve, SomeClass).result()
+
+        assert actual is self.container.resolve(SomeClass)
+
     @mark.parametrize('dependency, type_', [
         (Mock, Mock),
         (Container, Container),
@@ -129,6 +174,192 @@ class ScopesTests:
         assert dispose.call_args_list[0] == call(two)
         assert dispose.call_args_list[1] == call(one)
 
+    @mark.parametrize('threads_count', [2, 5])
+    def test_add_scoped_concurrently(self, threads_count):
+        """should create single instance for scope shared by threads"""
+        add_scoped(SomeClass, SomeClass)
+
+        def _resolve():
+            return [self.container.resolve(SomeClass) for _ in range(100)]
+
+        with DependencyScope():
+            with ThreadPoolExecutor(max_workers=threads_count) as executor:
+                futures = [executor.submit(copy_context().run, _resolve) for _ in range(threads_count)]
+                instances = {id(instance) for future in futures for instance in future.result()}
+
+        assert len(instances) == 1
+
+
+class DisposeTests:
+    """Scope disposing tests"""
+
+    @staticmethod
+    def test_reverse_order():
+        """should call exit callbacks in reverse order"""
+        calls = []
+
+        with DependencyScope() as actual:
+            actual.on_exit(lambda _: calls.append(1))
+            actual.on_exit(lambda _: calls.append(2))
+
+        assert calls == [2, 1]
+
+    @staticmethod
+    @mark.parametrize('concurrently', [False, True])
+    def test_errors(concurrently):
+        """should call all callbacks and raise collected errors"""
+        error = ValueError()
+        callback = Mock()
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            with raises(DisposeError) as actual:
+                with DependencyScope(executor if concurrently else None) as scope_:
+                    scope_.on_exit(callback)
+                    scope_.on_exit(Mock(side_effect=error))
+
+        callback.assert_called_once_with(scope_)
+        assert actual.value.errors == [error]
+
+    @staticmethod
+    def test_concurrently():
+        """should call callbacks concurrently using executor"""
+        event = Event()
+        waited = []
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            with DependencyScope(executor, timeout=5) as scope_:
+                scope_.on_exit(lambda _: event.set())
+                scope_.on_exit(lambda _: waited.append(event.wait(5)))
+
+        assert waited == [True]
+
+    @staticmethod
+    def test_timeout():
+        """should raise timeout error for not finished callbacks"""
+        event = Event()
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            with raises(DisposeError) as actual:
+                with DependencyScope(executor, timeout=0.01) as scope_:
+                    scope_.on_exit(lambda _: event.wait(5))
+            event.set()
+
+        assert isinstance(actual.value.errors[0], TimeoutError)
+
+    @staticmethod
+    def test_timeout_calls_queued_callbacks():
+        """should call not started callbacks if executor is blocked by timed out callback"""
+        event = Event()
+        callback = Mock()
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            with raises(DisposeError) as actual:
+                with DependencyScope(executor, timeout=0.05) as scope_:
+                    scope_.on_exit(callback)
+                    scope_.on_exit(lambda _: event.wait(5))
+            event.set()
+
+        callback.assert_called_once_with(scope_)
+        assert len(actual.value.errors) == 1
+        assert isinstance(actual.value.errors[0], TimeoutError)
+
+    @staticmethod
+    def test_timeout_not_started_callbacks():
+        """should call callbacks which are not started in timeout because executor is busy"""
+        event = Event()
+        callback = Mock()
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            executor.submit(event.wait, 5)
+            start = perf_counter()
+            with DependencyScope(executor, timeout=0.1) as scope_:
+                scope_.on_exit(callback)
+            duration = perf_counter() - start
+            event.set()
+
+        callback.assert_called_once_with(scope_)
+        assert duration < 1
+
+    @staticmethod
+    def test_executor_shutdown():
+        """should call callbacks if executor can not be used"""
+        callback = Mock()
+        executor = ThreadPoolExecutor(max_workers=1)
+        executor.shutdown()
+
+        with DependencyScope(executor) as scope_:
+            scope_.on_exit(callback)
+            scope_.on_exit(callback)
+
+        assert callback.call_count == 2
+
+    @staticmethod
+    def test_timeout_per_callback():
+        """timeout should be counted from start of every callback"""
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            with DependencyScope(executor, timeout=0.5) as scope_:
+                for _ in range(3):
+                    scope_.on_exit(lambda _: sleep(0.3))
+
+    @staticmethod
+    def test_timeout_without_executor():
+        """should raise error if timeout is passed without executor"""
+        with raises(ValueError):
+            DependencyScope(timeout=1)
+
+        with raises(ValueError):
+            scope(timeout=1)
+
+    @staticmethod
+    def test_dispose():
+        """dispose() should call exit callbacks once"""
+        callback = Mock()
+        actual = DependencyScope()
+        actual.on_exit(callback)
+
+        actual.dispose()
+        actual.dispose()
+
+        callback.assert_called_once_with(actual)
+
+    @staticmethod
+    def test_use_scope():
+        """use_scope() should set scope as current without disposing"""
+        container = Container()
+        dispose = Mock()
+        with use_container(container):
+            add_scoped(SomeClass, SomeClass, dispose)
+            actual = DependencyScope()
+
+            with use_scope(actual) as used:
+                instance = resolve(SomeClass)
+            with use_scope(actual):
+                assert resolve(SomeClass) is instance
+            assert resolve(SomeClass) is not instance
+
+        assert used is actual
+        dispose.assert_not_called()
+
+    @staticmethod
+    def test_concurrently_in_context():
+        """should call callbacks in executor with current container"""
+        containers = []
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            with use_container() as container:
+                with DependencyScope(executor) as scope_:
+                    scope_.on_exit(lambda _: containers.append(get_container()))
+
+        assert containers == [container]
+
+    @staticmethod
+    def test_dispose_duration():
+        """should set dispose duration"""
+        with DependencyScope() as actual:
+            assert actual.dispose_duration is None
+
+        assert actual.dispose_duration >= 0
+
 
 @mark.usefixtures(container_fixture.__name__)
 class ThreadTests:
@@ -167,3 +398,15 @@ class ThreadTests:
             two = future.result()
 
         assert one != two
+
+    def test_add_per_thread_sequential_threads(self):
+        """should return new instance for every thread started after previous one is finished"""
+        add_per_thread(SomeClass, SomeClass)
+        instances = []
+
+        for _ in range(5):
+            thread = Thread(target=lambda: instances.append(self.container.resolve(SomeClass)))
+            thread.start()
+            thread.join()
+
+        assert len({id(instance) for instance in instances}) == 5